@@ -6,13 +6,21 @@ FIXED VERSION v2 - All code in one file, all bugs fixed
 """
 
 import streamlit as st
-import json
+import html
+import math
 import os
 from datetime import datetime
-from collections import Counter, defaultdict
+from collections import Counter
 from enum import Enum
 from uuid import uuid4
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+try:
+    import orjson  # Optional C-backed JSON; stdlib json is used otherwise
+except ImportError:
+    orjson = None
+    import json
 
 
 # ============================================================================
@@ -33,9 +41,35 @@ class Priority(str, Enum):
     HIGH = "high"
 
 
-@dataclass
+CATEGORY_EMOJI = {
+    Category.TASK: '✓',
+    Category.IDEA: '💡',
+    Category.WORRY: '⚠️'
+}
+
+# Display label per category, e.g. "💡 Idea"
+CATEGORY_LABEL = {c: f"{CATEGORY_EMOJI[c]} {c.value.capitalize()}" for c in Category}
+
+# Higher rank sorts first when sorting with reverse=True
+PRIORITY_RANK = {
+    Priority.HIGH: 2,
+    Priority.MEDIUM: 1,
+    Priority.LOW: 0
+}
+
+
+def _now_iso() -> str:
+    """Timestamp shared by every mutation in the current script run"""
+    now = st.session_state.get('_now')
+    if now is None:
+        now = datetime.now().isoformat()
+        st.session_state['_now'] = now
+    return now
+
+
+@dataclass(slots=True)
 class Thought:
-    """Thought data model"""
+    """Thought data model (slotted: no per-instance __dict__)"""
     text: str
     category: Category
     priority: Priority = Priority.MEDIUM
@@ -44,16 +78,24 @@ class Thought:
     created_at: str = None
     updated_at: str = None
     
+    # Derived: (created_at, priority rank) for a single-pass sort
+    _sort_key: tuple = field(default=None, init=False, repr=False, compare=False)
+    # Derived: lowercased text, computed once per load for substring search
+    _text_lower: str = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize auto-generated fields"""
         if self.id is None:
             self.id = str(uuid4())
         
-        now = datetime.now().isoformat()
-        if self.created_at is None:
-            self.created_at = now
-        if self.updated_at is None:
-            self.updated_at = now
+        # Thoughts loaded from disk already carry both timestamps
+        if self.created_at is None or self.updated_at is None:
+            now = _now_iso()
+            self.created_at = self.created_at or now
+            self.updated_at = self.updated_at or now
+        
+        self._sort_key = (self.created_at, PRIORITY_RANK[self.priority])
+        self._text_lower = self.text.lower()
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -83,54 +125,161 @@ class Thought:
     def mark_complete(self):
         """Mark thought as completed"""
         self.completed = True
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
     
     def mark_incomplete(self):
         """Mark thought as incomplete"""
         self.completed = False
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = _now_iso()
 
 
 # ============================================================================
 # STORAGE MANAGER (from storage.py)
 # ============================================================================
 
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@st.cache_data(show_spinner=False, max_entries=1)  # Only the current file state is ever reused
+def _load_cached(path: str, stamp: tuple) -> tuple:
+    """Replay the thought log from disk (cached until the file's (mtime_ns, size) stamp changes)
+    
+    Returns (live thought dicts, number of log lines).
+    """
+    records = {}
+    lines = 0
+    
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            
+            lines += 1
+            item = _loads(line)
+            
+            # Tombstone: drop the record, otherwise last write wins
+            if '_deleted' in item:
+                records.pop(item['_deleted'], None)
+            else:
+                records[item['id']] = item
+    
+    return list(records.values()), lines
+
+
 class StorageManager:
-    """Handles all data persistence"""
+    """Handles all data persistence
     
-    def __init__(self, filename: str = "axon_thoughts.json"):
+    Thoughts are kept in an append-only JSON-Lines log: add/update append the
+    full record, delete appends a tombstone, and the log is compacted once it
+    grows past twice the number of live thoughts. Records are buffered in
+    memory and written by flush(), once per script run.
+    """
+    
+    def __init__(self, filename: str = "axon_thoughts.jsonl"):
         """Initialize storage manager"""
         self.filename = filename
+        self._log_lines = 0
+        self._live_count = 0
+        self._pending = []
+        self.version = 0  # Bumped on every mutation; lets callers memoize derived data
+        self._migrate_legacy()
+    
+    @property
+    def dirty(self) -> bool:
+        """True when there are buffered records not yet written to disk"""
+        return bool(self._pending)
+    
+    def _migrate_legacy(self):
+        """Import a pre-JSONL axon_thoughts.json store on first run"""
+        legacy = os.path.splitext(self.filename)[0] + ".json"
+        
+        if os.path.exists(self.filename) or not os.path.exists(legacy):
+            return
+        
+        try:
+            with open(legacy, 'rb') as f:
+                data = _loads(f.read())
+            self.save([Thought.from_dict(item) for item in data])
+        except Exception as e:
+            print(f"Error migrating thoughts: {e}")
     
     def load(self):
         """Load all thoughts from storage"""
+        self.flush()
+        
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    return [Thought.from_dict(item) for item in data]
+                # Size as well as mtime: an append within the same mtime tick still grows the file
+                stat = os.stat(self.filename)
+                data, self._log_lines = _load_cached(self.filename, (stat.st_mtime_ns, stat.st_size))
+                self._live_count = len(data)
+                return [Thought.from_dict(item) for item in data]
         except Exception as e:
             print(f"Error loading thoughts: {e}")
         
         return []
     
     def save(self, thoughts) -> bool:
-        """Save all thoughts to storage"""
+        """Rewrite the log with only the given thoughts"""
         try:
-            with open(self.filename, 'w') as f:
-                data = [thought.to_dict() for thought in thoughts]
-                json.dump(data, f, indent=2)
+            # Write a sibling file and swap it in, so an interrupted rewrite leaves the old log intact
+            tmp = self.filename + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.writelines(_dumps(thought.to_dict()) + b'\n' for thought in thoughts)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filename)
+            self._log_lines = self._live_count = len(thoughts)
+            self._pending.clear()
             return True
         except Exception as e:
             print(f"Error saving thoughts: {e}")
             return False
     
+    def compact(self) -> bool:
+        """Drop superseded records and tombstones from the log"""
+        return self.save(self.load())
+    
+    def _append(self, record: dict) -> bool:
+        """Buffer a single record for the next flush()"""
+        self._pending.append(_dumps(record) + b'\n')
+        self._log_lines += 1
+        self.version += 1
+        return True
+    
+    def flush(self) -> bool:
+        """Write buffered records to the log in one append"""
+        if not self._pending:
+            return True
+        
+        try:
+            with open(self.filename, 'ab') as f:
+                f.writelines(self._pending)
+            self._pending.clear()
+            
+            if self._log_lines > 2 * max(self._live_count, 1):
+                return self.compact()
+            return True
+        except Exception as e:
+            print(f"Error flushing thoughts: {e}")
+            return False
+    
     def add(self, thought) -> bool:
         """Add a new thought"""
         try:
-            thoughts = self.load()
-            thoughts.append(thought)
-            return self.save(thoughts)
+            self._live_count += 1
+            return self._append(thought.to_dict())
         except Exception as e:
             print(f"Error adding thought: {e}")
             return False
@@ -138,12 +287,7 @@ class StorageManager:
     def update(self, thought_id: str, thought) -> bool:
         """Update an existing thought"""
         try:
-            thoughts = self.load()
-            for i, t in enumerate(thoughts):
-                if t.id == thought_id:
-                    thoughts[i] = thought
-                    return self.save(thoughts)
-            return False
+            return self._append(thought.to_dict())
         except Exception as e:
             print(f"Error updating thought: {e}")
             return False
@@ -151,9 +295,8 @@ class StorageManager:
     def delete(self, thought_id: str) -> bool:
         """Delete a thought"""
         try:
-            thoughts = self.load()
-            thoughts = [t for t in thoughts if t.id != thought_id]
-            return self.save(thoughts)
+            self._live_count -= 1
+            return self._append({'_deleted': thought_id})
         except Exception as e:
             print(f"Error deleting thought: {e}")
             return False
@@ -166,27 +309,27 @@ class StorageManager:
                 return t
         return None
     
-    def export_csv(self) -> str:
-        """Export thoughts as CSV"""
+    def export_csv(self, thoughts=None) -> str:
+        """Export thoughts as CSV (loads from disk unless a list is given)"""
+        import csv
+        import io
+        
         try:
-            thoughts = self.load()
+            if thoughts is None:
+                thoughts = self.load()
             
             if not thoughts:
                 return ""
             
-            csv_lines = ["id,text,category,priority,completed,created_at"]
-            
-            for thought in thoughts:
-                csv_lines.append(
-                    f'{thought.id},'
-                    f'"{thought.text}",'
-                    f'{thought.category.value},'
-                    f'{thought.priority.value},'
-                    f'{thought.completed},'
-                    f'{thought.created_at}'
-                )
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(('id', 'text', 'category', 'priority', 'completed', 'created_at'))
+            writer.writerows(
+                (t.id, t.text, t.category.value, t.priority.value, t.completed, t.created_at)
+                for t in thoughts
+            )
             
-            return '\n'.join(csv_lines)
+            return buf.getvalue()
         
         except Exception as e:
             print(f"Error exporting CSV: {e}")
@@ -200,9 +343,17 @@ class StorageManager:
 class ThoughtManager:
     """Manages thought operations"""
     
-    def __init__(self, storage):
-        """Initialize thought manager"""
+    def __init__(self, storage, thoughts=None):
+        """Initialize thought manager over the in-memory thought list"""
         self.storage = storage
+        self.thoughts = thoughts if thoughts is not None else storage.load()
+        self._by_id = {t.id: t for t in self.thoughts}
+        # Normalized text -> count, so exact duplicates are a hash lookup
+        self._normalized = Counter(t._text_lower.strip() for t in self.thoughts)
+        # Running counts behind get_stats(), kept in step with every mutation
+        self._by_category = Counter(t.category for t in self.thoughts)
+        self._by_priority = Counter(t.priority for t in self.thoughts)
+        self._completed = sum(t.completed for t in self.thoughts)
     
     def create_thought(self, text: str, category: Category, 
                       priority: Priority = Priority.MEDIUM):
@@ -231,27 +382,48 @@ class ThoughtManager:
         )
         
         if self.storage.add(thought):
+            self.thoughts.append(thought)
+            self._by_id[thought.id] = thought
+            self._normalized[thought._text_lower.strip()] += 1
+            self._by_category[category] += 1
+            self._by_priority[priority] += 1
             return True, f"✓ Created {category.value}"
         
         return False, "Failed to save thought"
     
     def delete_thought(self, thought_id: str):
         """Delete a thought"""
+        thought = self.get_by_id(thought_id)
+        
+        if not thought:
+            return False, "Thought not found"
+        
         if self.storage.delete(thought_id):
+            del self._by_id[thought_id]
+            self.thoughts.remove(thought)
+            key = thought._text_lower.strip()
+            self._normalized[key] -= 1
+            if not self._normalized[key]:
+                del self._normalized[key]
+            self._by_category[thought.category] -= 1
+            self._by_priority[thought.priority] -= 1
+            self._completed -= thought.completed
             return True, "✓ Deleted"
         return False, "Failed to delete"
     
     def toggle_complete(self, thought_id: str):
         """Toggle thought completion status"""
-        thought = self.storage.get_by_id(thought_id)
+        thought = self.get_by_id(thought_id)
         
         if not thought:
             return False, "Thought not found"
         
         if thought.completed:
             thought.mark_incomplete()
+            self._completed -= 1
         else:
             thought.mark_complete()
+            self._completed += 1
         
         if self.storage.update(thought_id, thought):
             status = "completed" if thought.completed else "incomplete"
@@ -259,9 +431,13 @@ class ThoughtManager:
         
         return False, "Failed to update"
     
+    def get_by_id(self, thought_id: str):
+        """Get a specific thought by ID"""
+        return self._by_id.get(thought_id)
+    
     def get_all(self):
         """Get all thoughts"""
-        return self.storage.load()
+        return self.thoughts
     
     def search(self, query: str):
         """Search thoughts by keyword"""
@@ -271,17 +447,17 @@ class ThoughtManager:
         query_lower = query.lower().strip()
         thoughts = self.get_all()
         
-        return [t for t in thoughts if query_lower in t.text.lower()]
+        return [t for t in thoughts if query_lower in t._text_lower]
     
     def filter_by_category(self, category: Category):
         """Filter thoughts by category"""
         thoughts = self.get_all()
-        return [t for t in thoughts if t.category == category]
+        return [t for t in thoughts if t.category is category]
     
     def filter_by_priority(self, priority: Priority):
         """Filter thoughts by priority"""
         thoughts = self.get_all()
-        return [t for t in thoughts if t.priority == priority]
+        return [t for t in thoughts if t.priority is priority]
     
     def filter_by_status(self, completed: bool):
         """Filter thoughts by completion status"""
@@ -290,13 +466,7 @@ class ThoughtManager:
     
     def sort_by_priority(self, thoughts):
         """Sort thoughts by priority (high → medium → low)"""
-        priority_order = {
-            Priority.HIGH: 0,
-            Priority.MEDIUM: 1,
-            Priority.LOW: 2
-        }
-        
-        return sorted(thoughts, key=lambda t: priority_order.get(t.priority, 3))
+        return sorted(thoughts, key=lambda t: -PRIORITY_RANK[t.priority])
     
     def sort_by_date(self, thoughts, newest_first: bool = True):
         """Sort thoughts by date"""
@@ -308,9 +478,9 @@ class ThoughtManager:
     
     def get_stats(self) -> dict:
         """Get statistics about thoughts - FIXED VERSION"""
-        thoughts = self.get_all()
+        total = len(self.thoughts)
         
-        if not thoughts:
+        if not total:
             return {
                 'total': 0,
                 'completed': 0,
@@ -320,56 +490,39 @@ class ThoughtManager:
                 'completion_rate': 0
             }
         
-        by_category = {}
-        by_priority = {}
-        completed_count = 0
-        
-        for thought in thoughts:
-            # Count by category
-            cat = thought.category.value
-            by_category[cat] = by_category.get(cat, 0) + 1
-            
-            # Count by priority
-            pri = thought.priority.value
-            by_priority[pri] = by_priority.get(pri, 0) + 1
-            
-            # Count completed
-            if thought.completed:
-                completed_count += 1
-        
-        completion_rate = round((completed_count / len(thoughts)) * 100, 1) if thoughts else 0
+        # Counts are maintained incrementally by create/delete/toggle; just read them out
+        completed_count = self._completed
+        completion_rate = round((completed_count / total) * 100, 1)
         
         return {
-            'total': len(thoughts),
+            'total': total,
             'completed': completed_count,
-            'pending': len(thoughts) - completed_count,
-            'by_category': by_category,
-            'by_priority': by_priority,
+            'pending': total - completed_count,
+            'by_category': {c.value: n for c, n in self._by_category.items() if n},
+            'by_priority': {p.value: n for p, n in self._by_priority.items() if n},
             'completion_rate': completion_rate
         }
     
     def _is_duplicate(self, text: str, threshold: float = 0.85) -> bool:
         """Check if thought is a duplicate"""
         text_lower = text.lower().strip()
-        thoughts = self.get_all()
         
-        for thought in thoughts:
-            thought_lower = thought.text.lower().strip()
-            
-            # Exact match
-            if text_lower == thought_lower:
-                return True
-            
-            # Contains check
-            if len(text_lower) > 10 and len(thought_lower) > 10:
-                if text_lower in thought_lower or thought_lower in text_lower:
-                    return True
+        # Exact match
+        if text_lower in self._normalized:
+            return True
+        
+        # Contains check (only meaningful between texts longer than 10 chars)
+        if len(text_lower) > 10:
+            for thought_lower in self._normalized:
+                if len(thought_lower) > 10:
+                    if text_lower in thought_lower or thought_lower in text_lower:
+                        return True
         
         return False
     
     def export_csv(self) -> str:
         """Export all thoughts as CSV"""
-        return self.storage.export_csv()
+        return self.storage.export_csv(self.thoughts)
 
 
 # ============================================================================
@@ -383,139 +536,108 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Professional SaaS Dark Theme
-st.markdown("""
-    <style>
-    :root {
-        --primary: #2563eb;
-        --primary-dark: #1e40af;
-        --primary-light: #3b82f6;
-        --bg-primary: #ffffff;
-        --bg-secondary: #f9fafb;
-        --text-primary: #111827;
-        --text-secondary: #6b7280;
-        --border: #e5e7eb;
-    }
-    
-    * {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Helvetica Neue', sans-serif;
-    }
-    
-    html, body, [data-testid="stAppViewContainer"] {
-        background-color: var(--bg-secondary);
-        color: var(--text-primary);
-    }
-    
-    [data-testid="stSidebar"] {
-        background-color: var(--bg-primary);
-        border-right: 1px solid var(--border);
-    }
-    
-    .header-container {
-        background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
-        color: white;
-        padding: 40px 30px;
-        border-radius: 0;
-        margin: -50px -50px 30px -50px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-    }
-    
-    .header-title {
-        font-size: 2.5rem;
-        font-weight: 800;
-        margin: 0 0 10px 0;
-        letter-spacing: -0.5px;
-    }
-    
-    .header-subtitle {
-        font-size: 1.1rem;
-        opacity: 0.95;
-        margin: 0;
-        font-weight: 400;
-    }
-    
-    .card {
-        background: var(--bg-primary);
-        border: 1px solid var(--border);
-        border-radius: 8px;
-        padding: 20px;
-        margin: 15px 0;
-        transition: all 0.2s ease;
-    }
-    
-    .card:hover {
-        border-color: var(--primary-light);
-        box-shadow: 0 4px 12px rgba(37, 99, 235, 0.1);
-    }
-    
-    .badge {
-        display: inline-block;
-        padding: 4px 12px;
-        border-radius: 6px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }
-    
-    .badge-task {
-        background-color: #dcfce7;
-        color: #166534;
-        border: 1px solid #86efac;
-    }
-    
-    .badge-idea {
-        background-color: #dbeafe;
-        color: #0c4a6e;
-        border: 1px solid #93c5fd;
-    }
-    
-    .badge-worry {
-        background-color: #fed7aa;
-        color: #92400e;
-        border: 1px solid #fdba74;
-    }
-    
-    .badge-high {
-        background-color: #fee2e2;
-        color: #7f1d1d;
-    }
-    
-    .badge-medium {
-        background-color: #fef3c7;
-        color: #78350f;
-    }
-    
-    .badge-low {
-        background-color: #dbeafe;
-        color: #0c2d5c;
-    }
-    
-    .stButton > button {
-        background: var(--primary);
-        color: white;
-        border: none;
-        border-radius: 6px;
-        padding: 10px 24px;
-        font-weight: 600;
-        transition: all 0.2s ease;
-    }
-    
-    .stButton > button:hover {
-        background: var(--primary-dark);
-        box-shadow: 0 4px 12px rgba(37, 99, 235, 0.3);
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Professional SaaS Dark Theme (axon.css, read once per server process)
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "axon.css")
+
+
+@st.cache_data(show_spinner=False)
+def _load_css(path: str) -> str:
+    """Read the stylesheet and wrap it in a <style> tag"""
+    with open(path, 'r') as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+st.markdown(_load_css(CSS_PATH), unsafe_allow_html=True)
+
+# Static page headers (plain constants, no per-rerun formatting)
+HEADER_HOME = """
+        <div class="header-container">
+            <div class="header-title">🧠 Axon Intelligence</div>
+            <div class="header-subtitle">Organize your thoughts. Understand your priorities.</div>
+        </div>
+    """
+
+HEADER_NEW = """
+        <div class="header-container">
+            <div class="header-title">Add a New Thought</div>
+            <div class="header-subtitle">Capture what's on your mind</div>
+        </div>
+    """
+
+HEADER_LIST = """
+        <div class="header-container">
+            <div class="header-title">Your Thoughts</div>
+            <div class="header-subtitle">Manage and organize your ideas</div>
+        </div>
+    """
+
+HEADER_ANALYTICS = """
+        <div class="header-container">
+            <div class="header-title">Analytics</div>
+            <div class="header-subtitle">Insights into your thoughts</div>
+        </div>
+    """
+
+# Thoughts rendered per page on the All Thoughts page
+PAGE_SIZE = 25
+
+
+def _card_html(thought) -> str:
+    """Read-only HTML card for one thought"""
+    category_badge = f'<span class="badge badge-{thought.category.value}">{CATEGORY_LABEL[thought.category]}</span>'
+    
+    priority_badge = f'<span class="badge badge-{thought.priority.value}">{thought.priority.value.capitalize()}</span>'
+    
+    return (
+        f'<div class="card">'
+        f'<div style="margin-bottom: 8px;">{category_badge} {priority_badge}</div>'
+        f'<div style="text-decoration: {"line-through" if thought.completed else "none"}; opacity: {"0.6" if thought.completed else "1"};">'
+        f'{html.escape(thought.text)}'
+        f'</div>'
+        f'<small style="color: #6b7280;">📅 {thought.created_at[:10]}</small>'
+        f'</div>'
+    )
 
 # ============================================================================
 # INITIALIZATION
 # ============================================================================
 
+# Fresh timestamp for this run (see _now_iso)
+st.session_state.pop('_now', None)
+
 if 'storage' not in st.session_state:
     st.session_state.storage = StorageManager()
 
+if 'thoughts' not in st.session_state:
+    st.session_state.thoughts = st.session_state.storage.load()
+
 if 'manager' not in st.session_state:
-    st.session_state.manager = ThoughtManager(st.session_state.storage)
+    st.session_state.manager = ThoughtManager(
+        st.session_state.storage,
+        st.session_state.thoughts
+    )
+
+
+def _stats_this_run() -> dict:
+    """get_stats() memoized until the next storage mutation"""
+    version = st.session_state.storage.version
+    if st.session_state.get('_stats_version') != version:
+        st.session_state._stats = st.session_state.manager.get_stats()
+        st.session_state._stats_version = version
+    return st.session_state._stats
+
+def _rerun():
+    """Write buffered records, then rerun (st.rerun() skips the end-of-run flush)"""
+    st.session_state.storage.flush()
+    st.rerun()
+
+def _csv_this_run() -> str:
+    """export_csv() memoized until the next storage mutation"""
+    version = st.session_state.storage.version
+    if st.session_state.get('_csv_version') != version:
+        st.session_state._csv = st.session_state.manager.export_csv()
+        st.session_state._csv_version = version
+    return st.session_state._csv
 
 # ============================================================================
 # SIDEBAR
@@ -535,7 +657,7 @@ with st.sidebar:
     
     st.markdown("---")
     
-    stats = st.session_state.manager.get_stats()
+    stats = _stats_this_run()
     
     col1, col2 = st.columns(2)
     with col1:
@@ -545,27 +667,23 @@ with st.sidebar:
     
     st.markdown("---")
     
-    if st.button("📥 Export CSV", use_container_width=True):
-        csv_data = st.session_state.manager.export_csv()
-        if csv_data:
-            st.download_button(
-                label="Download CSV",
-                data=csv_data,
-                file_name=f"axon_thoughts_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv"
-            )
+    # Offered directly; no separate click to generate the file first
+    csv_data = _csv_this_run()
+    if csv_data:
+        st.download_button(
+            label="📥 Export CSV",
+            data=csv_data,
+            file_name=f"axon_thoughts_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
 
 # ============================================================================
 # PAGE: HOME
 # ============================================================================
 
 if page == "🏠 Home":
-    st.markdown("""
-        <div class="header-container">
-            <div class="header-title">🧠 Axon Intelligence</div>
-            <div class="header-subtitle">Organize your thoughts. Understand your priorities.</div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HOME, unsafe_allow_html=True)
     
     st.markdown("")
     
@@ -598,7 +716,7 @@ if page == "🏠 Home":
     with col2:
         st.markdown("### Quick Stats")
         
-        stats = st.session_state.manager.get_stats()
+        stats = _stats_this_run()
         
         col1, col2 = st.columns(2)
         with col1:
@@ -616,7 +734,7 @@ if page == "🏠 Home":
     
     st.markdown("### Categories")
     
-    stats = st.session_state.manager.get_stats()
+    stats = _stats_this_run()
     by_category = stats['by_category']
     
     if by_category:
@@ -640,12 +758,7 @@ if page == "🏠 Home":
 # ============================================================================
 
 elif page == "➕ New Thought":
-    st.markdown("""
-        <div class="header-container">
-            <div class="header-title">Add a New Thought</div>
-            <div class="header-subtitle">Capture what's on your mind</div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_NEW, unsafe_allow_html=True)
     
     st.markdown("")
     
@@ -664,7 +777,7 @@ elif page == "➕ New Thought":
         category = st.selectbox(
             "Category",
             [Category.TASK, Category.IDEA, Category.WORRY],
-            format_func=lambda x: f"{['✓', '💡', '⚠️'][list(Category).index(x)]} {x.value.capitalize()}"
+            format_func=lambda x: CATEGORY_LABEL[x]
         )
         
         priority = st.selectbox(
@@ -693,19 +806,14 @@ elif page == "➕ New Thought":
     
     with col2:
         if st.button("Clear", use_container_width=True):
-            st.rerun()
+            _rerun()
 
 # ============================================================================
 # PAGE: ALL THOUGHTS
 # ============================================================================
 
 elif page == "📋 All Thoughts":
-    st.markdown("""
-        <div class="header-container">
-            <div class="header-title">Your Thoughts</div>
-            <div class="header-subtitle">Manage and organize your ideas</div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_LIST, unsafe_allow_html=True)
     
     st.markdown("")
     
@@ -718,7 +826,7 @@ elif page == "📋 All Thoughts":
         filter_category = st.selectbox(
             "Category",
             [None] + list(Category),
-            format_func=lambda x: "All Categories" if x is None else f"{['✓', '💡', '⚠️'][list(Category).index(x)]} {x.value.capitalize()}"
+            format_func=lambda x: "All Categories" if x is None else CATEGORY_LABEL[x]
         )
     
     with col3:
@@ -736,84 +844,97 @@ elif page == "📋 All Thoughts":
     
     st.divider()
     
-    thoughts = st.session_state.manager.get_all()
+    query = search_query.lower().strip() if search_query else ""
+    want_completed = None if filter_status == "All" else filter_status == "Completed"
     
-    if search_query:
-        thoughts = st.session_state.manager.search(search_query)
-    
-    if filter_category:
-        thoughts = [t for t in thoughts if t.category == filter_category]
-    
-    if filter_priority:
-        thoughts = [t for t in thoughts if t.priority == filter_priority]
-    
-    if filter_status == "Pending":
-        thoughts = [t for t in thoughts if not t.completed]
-    elif filter_status == "Completed":
-        thoughts = [t for t in thoughts if t.completed]
+    def keep(t):
+        """Combined filter, cheapest checks first"""
+        return (
+            (filter_category is None or t.category is filter_category)
+            and (filter_priority is None or t.priority is filter_priority)
+            and (want_completed is None or t.completed == want_completed)
+            and (not query or query in t._text_lower)
+        )
     
-    thoughts = st.session_state.manager.sort_by_priority(thoughts)
-    thoughts = st.session_state.manager.sort_by_date(thoughts, newest_first=True)
+    # Reruns that leave the filters and the data unchanged (paging, typing the same query)
+    # reuse the previous result
+    list_key = (filter_category, filter_priority, want_completed, query, st.session_state.storage.version)
+    if st.session_state.get('_list_key') == list_key:
+        thoughts = st.session_state._list
+    else:
+        # One pass over the in-memory list; newest first, higher priority first on equal timestamps
+        # (with a single priority selected only the date needs comparing)
+        thoughts = sorted(
+            (t for t in st.session_state.thoughts if keep(t)),
+            key=attrgetter('_sort_key' if filter_priority is None else 'created_at'),
+            reverse=True
+        )
+        st.session_state._list = thoughts
+        st.session_state._list_key = list_key
     
     if not thoughts:
         st.info("No thoughts found.")
     else:
         st.markdown(f"**{len(thoughts)} thought{'s' if len(thoughts) != 1 else ''} found**")
+        
+        # Only the current page of thoughts is rendered
+        total = len(thoughts)
+        page_count = math.ceil(total / PAGE_SIZE)
+        page_num = st.number_input("Page", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+        start = (page_num - 1) * PAGE_SIZE
+        thoughts = thoughts[start:start + PAGE_SIZE]
+        st.caption(f"Showing {start + 1}–{start + len(thoughts)} of {total}")
+        
         st.divider()
         
-        for thought in thoughts:
-            col1, col2 = st.columns([0.1, 0.9])
-            
-            with col1:
-                is_checked = st.checkbox(
-                    "",
-                    value=thought.completed,
-                    key=f"complete_{thought.id}"
-                )
-                
-                if is_checked != thought.completed:
+        # Read-only cards in a single markdown call
+        st.markdown("\n".join(_card_html(t) for t in thoughts), unsafe_allow_html=True)
+        
+        st.divider()
+        st.markdown("**Manage**")
+        
+        # One editor for completion toggles and deletes instead of per-thought widgets,
+        # inside a form so edits are applied together on submit rather than one rerun per cell;
+        # the key is bumped after applying changes so stale edits are not replayed
+        editor_key = f"thoughts_editor_{st.session_state.get('editor_rev', 0)}"
+        with st.form("manage_thoughts"):
+            edited = st.data_editor(
+                [{"done": t.completed, "thought": t.text, "delete": False} for t in thoughts],
+                column_config={
+                    "done": st.column_config.CheckboxColumn("Done"),
+                    "thought": st.column_config.TextColumn("Thought", disabled=True),
+                    "delete": st.column_config.CheckboxColumn("🗑️ Delete")
+                },
+                hide_index=True,
+                use_container_width=True,
+                key=editor_key
+            )
+            submitted = st.form_submit_button("Apply changes")
+        
+        if submitted:
+            changed = False
+            for thought, row in zip(thoughts, edited):
+                if row["delete"]:
+                    st.session_state.manager.delete_thought(thought.id)
+                    changed = True
+                elif row["done"] != thought.completed:
                     st.session_state.manager.toggle_complete(thought.id)
-                    st.rerun()
+                    changed = True
             
-            with col2:
-                category_emoji = {'task': '✓', 'idea': '💡', 'worry': '⚠️'}
-                category_badge = f'<span class="badge badge-{thought.category.value}">{category_emoji[thought.category.value]} {thought.category.value.capitalize()}</span>'
-                
-                priority_badge = f'<span class="badge badge-{thought.priority.value}">{thought.priority.value.capitalize()}</span>'
-                
-                st.markdown(f"""
-                <div class="card">
-                    <div style="margin-bottom: 8px;">
-                        {category_badge}
-                        {priority_badge}
-                    </div>
-                    <div style="text-decoration: {'line-through' if thought.completed else 'none'}; opacity: {'0.6' if thought.completed else '1'};">
-                        {thought.text}
-                    </div>
-                    <small style="color: #6b7280;">📅 {thought.created_at[:10]}</small>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                if st.button("🗑️ Delete", key=f"delete_{thought.id}"):
-                    st.session_state.manager.delete_thought(thought.id)
-                    st.success("Deleted")
-                    st.rerun()
+            if changed:
+                st.session_state.editor_rev = st.session_state.get('editor_rev', 0) + 1
+                _rerun()
 
 # ============================================================================
 # PAGE: ANALYTICS
 # ============================================================================
 
 elif page == "📊 Analytics":
-    st.markdown("""
-        <div class="header-container">
-            <div class="header-title">Analytics</div>
-            <div class="header-subtitle">Insights into your thoughts</div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_ANALYTICS, unsafe_allow_html=True)
     
     st.markdown("")
     
-    stats = st.session_state.manager.get_stats()
+    stats = _stats_this_run()
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -834,8 +955,7 @@ elif page == "📊 Analytics":
         st.markdown("### By Category")
         if stats['by_category']:
             for cat, count in stats['by_category'].items():
-                emoji = {'task': '✓', 'idea': '💡', 'worry': '⚠️'}[cat]
-                st.metric(f"{emoji} {cat.capitalize()}", count)
+                st.metric(CATEGORY_LABEL[Category(cat)], count)
         else:
             st.info("No data yet")
     
@@ -872,4 +992,8 @@ st.markdown("""
 <p>🧠 <strong>Axon Intelligence</strong></p>
 <p>Production-ready thought organization system</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# Persist this run's mutations with a single write
+if st.session_state.storage.dirty:
+    st.session_state.storage.flush()
\ No newline at end of file
@@ -7,7 +7,9 @@ from typing import List, Optional, Tuple
 from models import Thought, Category, Priority, Status, Analytics
 from storage import StorageManager
 from datetime import datetime, timedelta
+from collections import Counter
 from difflib import SequenceMatcher
+from operator import attrgetter
 import re
 
 
@@ -28,9 +30,17 @@ class ThoughtManager:
         'worry': ['stressed', 'worried', 'anxious', 'afraid', 'scared', 'concerned', 'nervous', 'doubt']
     }
     
+    # Every keyword from both tables, so a text is scanned once for all of them
+    ALL_KEYWORDS = frozenset(
+        keyword
+        for keywords in (*PRIORITY_KEYWORDS.values(), *CATEGORY_KEYWORDS.values())
+        for keyword in keywords
+    )
+    
     def __init__(self, storage: StorageManager):
         """Initialize with storage backend"""
         self.storage = storage
+        self._last_hits = (None, frozenset())
     
     # ========== CORE CRUD OPERATIONS ==========
     
@@ -134,7 +144,7 @@ class ThoughtManager:
         if not thought:
             return False, "Thought not found"
         
-        if thought.status == Status.COMPLETED:
+        if thought.status is Status.COMPLETED:
             thought.mark_incomplete()
             status_str = "incomplete"
         else:
@@ -165,66 +175,63 @@ class ThoughtManager:
         Returns:
             Filtered and sorted list of thoughts
         """
-        thoughts = self.storage.load()
-        
-        # Remove deleted (but keep archived if requested)
-        thoughts = [t for t in thoughts if not t.is_deleted]
-        
-        # Filter by archive status
-        if not include_archived:
-            thoughts = [t for t in thoughts if not t.is_archived]
-        
-        # Apply filters
-        if search:
-            search_lower = search.lower()
-            thoughts = [t for t in thoughts if search_lower in t.text.lower()]
-        
-        if category:
-            thoughts = [t for t in thoughts if t.category == category]
-        
-        if priority:
-            thoughts = [t for t in thoughts if t.priority == priority]
-        
-        if completed is not None:
-            status = Status.COMPLETED if completed else Status.ACTIVE
-            thoughts = [t for t in thoughts if (t.status == status) == completed]
+        search_lower = search.lower() if search else None
+        done = Status.COMPLETED  # Local alias; read once per element below
+        
+        # Single pass over the loaded thoughts, cheapest checks first and the
+        # substring search last
+        thoughts = [
+            t for t in self.storage.load()
+            if not t.is_deleted
+            and (include_archived or not t.is_archived)
+            and (category is None or t.category is category)
+            and (priority is None or t.priority is priority)
+            and (completed is None or (t.status is done) == completed)
+            and (search_lower is None or search_lower in t._text_lower)
+        ]
         
         # Apply sorting
         if sort_by == "priority_date":
-            priority_order = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
-            thoughts.sort(key=lambda t: (priority_order.get(t.priority, 3), t.created_at), reverse=True)
+            thoughts.sort(key=attrgetter('_priority_rank', 'created_at'), reverse=True)
         elif sort_by == "priority":
-            priority_order = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
-            thoughts.sort(key=lambda t: priority_order.get(t.priority, 3))
+            thoughts.sort(key=attrgetter('_priority_rank'))
         elif sort_by == "date" or sort_by == "newest":
-            thoughts.sort(key=lambda t: t.created_at, reverse=True)
+            thoughts.sort(key=attrgetter('created_at'), reverse=True)
         elif sort_by == "oldest":
-            thoughts.sort(key=lambda t: t.created_at)
+            thoughts.sort(key=attrgetter('created_at'))
         elif sort_by == "name":
-            thoughts.sort(key=lambda t: t.text)
+            thoughts.sort(key=attrgetter('text'))
         
         return thoughts
     
     # ========== AI FEATURES ==========
     
+    def _keyword_hits(self, text: str) -> frozenset:
+        """Keywords found in text; the last result is reused for the same text"""
+        last_text, hits = self._last_hits
+        if text != last_text:
+            text_lower = text.lower()
+            hits = frozenset(keyword for keyword in self.ALL_KEYWORDS if keyword in text_lower)
+            self._last_hits = (text, hits)
+        return hits
+    
     def _auto_detect_priority(self, text: str) -> Priority:
         """Auto-detect priority from text"""
-        text_lower = text.lower()
+        hits = self._keyword_hits(text)
         
         for priority_level, keywords in self.PRIORITY_KEYWORDS.items():
-            if any(keyword in text_lower for keyword in keywords):
+            if not hits.isdisjoint(keywords):
                 return Priority(priority_level)
         
         return Priority.MEDIUM
     
     def _auto_detect_category(self, text: str) -> Category:
         """Auto-detect category from text"""
-        text_lower = text.lower()
+        hits = self._keyword_hits(text)
         scores = {}
         
         for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            scores[category] = score
+            scores[category] = len(hits.intersection(keywords))
         
         # Find category with highest score
         best_category = max(scores, key=scores.get)
@@ -232,7 +239,6 @@ class ThoughtManager:
     
     def _get_confidence(self, text: str, detected_type) -> float:
         """Get confidence score for AI detection"""
-        text_lower = text.lower()
         keywords = []
         
         if isinstance(detected_type, Priority):
@@ -243,7 +249,7 @@ class ThoughtManager:
         if not keywords:
             return 0.5
         
-        matches = sum(1 for keyword in keywords if keyword in text_lower)
+        matches = len(self._keyword_hits(text).intersection(keywords))
         confidence = min(0.95, 0.5 + (matches * 0.15))
         return confidence
     
@@ -262,11 +268,33 @@ class ThoughtManager:
         best_match = 0.0
         best_thought = None
         
+        text_lower = text.lower()
+        text_len = len(text_lower)
+        matcher = SequenceMatcher(None, text_lower)
+        
         for thought in thoughts:
             if thought.is_deleted:
                 continue
             
-            similarity = SequenceMatcher(None, text.lower(), thought.text.lower()).ratio()
+            thought_lower = thought._text_lower
+            
+            # Exact match can't be beaten
+            if thought_lower == text_lower:
+                return 1.0, thought
+            
+            # Length bound (what real_quick_ratio() computes), checked before
+            # set_seq2() indexes the candidate
+            total_len = text_len + len(thought_lower)
+            if 2.0 * min(text_len, len(thought_lower)) / total_len <= best_match:
+                continue
+            
+            # quick_ratio() is a tighter, still cheap upper bound on ratio(); only
+            # run the full comparison when it could beat the current best
+            matcher.set_seq2(thought_lower)
+            if matcher.quick_ratio() <= best_match:
+                continue
+            
+            similarity = matcher.ratio()
             
             if similarity > best_match:
                 best_match = similarity
@@ -282,30 +310,38 @@ class ThoughtManager:
     def get_analytics(self) -> Analytics:
         """Get comprehensive analytics"""
         thoughts = self.storage.load()
-        active_thoughts = [t for t in thoughts if not t.is_deleted and not t.is_archived]
         
         if not thoughts:
             return Analytics()
         
-        # Count statistics
-        total = len([t for t in thoughts if not t.is_deleted])
-        completed = len([t for t in thoughts if t.status == Status.COMPLETED and not t.is_deleted])
-        archived = len([t for t in thoughts if t.is_archived])
-        active = len(active_thoughts)
+        # Count statistics in a single pass
+        total = completed = archived = 0
+        category_counts = Counter()
+        priority_counts = Counter()
+        confidence_sum = 0.0
+        active_thoughts = []
+        done = Status.COMPLETED
+        add_active = active_thoughts.append
+        
+        for t in thoughts:
+            if t.is_deleted:
+                continue
+            total += 1
+            if t.status is done:
+                completed += 1
+            if t.is_archived:
+                archived += 1
+                continue
+            add_active(t)
+            category_counts[t.category] += 1
+            priority_counts[t.priority] += 1
+            confidence_sum += t.confidence
         
-        # By category
-        by_category = {}
-        for cat in Category:
-            count = len([t for t in active_thoughts if t.category == cat])
-            if count > 0:
-                by_category[cat.value] = count
+        active = len(active_thoughts)
         
-        # By priority
-        by_priority = {}
-        for pri in Priority:
-            count = len([t for t in active_thoughts if t.priority == pri])
-            if count > 0:
-                by_priority[pri.value] = count
+        # By category / priority, in enum order
+        by_category = {cat.value: category_counts[cat] for cat in Category if category_counts[cat]}
+        by_priority = {pri.value: priority_counts[pri] for pri in Priority if priority_counts[pri]}
         
         # Completion rate
         completion_rate = (completed / total * 100) if total > 0 else 0.0
@@ -314,7 +350,7 @@ class ThoughtManager:
         weekly_trend = self._get_weekly_trend(active_thoughts)
         
         # Average confidence
-        avg_confidence = sum(t.confidence for t in active_thoughts) / len(active_thoughts) if active_thoughts else 0.0
+        avg_confidence = confidence_sum / active if active else 0.0
         
         return Analytics(
             total_thoughts=total,
@@ -332,8 +368,14 @@ class ThoughtManager:
         """Get daily activity for last 7 days"""
         trend = [0] * 7
         now = datetime.now()
+        # ISO timestamps order chronologically as strings, so anything at or before
+        # the cutoff is at least a week old and is skipped without parsing
+        cutoff = (now - timedelta(days=7)).isoformat()
         
         for thought in thoughts:
+            if thought.created_at <= cutoff:
+                continue
+            
             created = datetime.fromisoformat(thought.created_at)
             days_ago = (now - created).days
             
@@ -348,22 +390,4 @@ class ThoughtManager:
     
     def export_csv(self) -> str:
         """Export thoughts as CSV"""
-        thoughts = self.storage.load()
-        
-        if not thoughts:
-            return ""
-        
-        csv_lines = ["id,text,category,priority,status,created_at"]
-        
-        for thought in thoughts:
-            if not thought.is_deleted:
-                csv_lines.append(
-                    f'{thought.id},'
-                    f'"{thought.text}",'
-                    f'{thought.category.value},'
-                    f'{thought.priority.value},'
-                    f'{thought.status.value},'
-                    f'{thought.created_at}'
-                )
-        
-        return '\n'.join(csv_lines)
\ No newline at end of file
+        return self.storage.export_csv()
\ No newline at end of file
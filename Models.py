@@ -32,7 +32,11 @@ class Status(str, Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+# Sort rank per priority level (HIGH first when sorting ascending)
+PRIORITY_ORDER = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
+
+
+@dataclass(slots=True)
 class Thought:
     """Advanced thought data model with full integrity support"""
     
@@ -43,8 +47,8 @@ class Thought:
     
     # Auto-generated fields
     id: str = field(default_factory=lambda: str(uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: Optional[str] = None  # Filled in __post_init__ with a single timestamp
+    updated_at: Optional[str] = None
     
     # Optional fields
     tags: List[str] = field(default_factory=list)
@@ -53,6 +57,13 @@ class Thought:
     is_deleted: bool = False  # Soft delete flag
     deleted_at: Optional[str] = None
     
+    # Derived: lowercased text, computed once for search and duplicate checks
+    _text_lower: str = field(default=None, init=False, repr=False, compare=False)
+    # Derived: PRIORITY_ORDER rank, so sort keys are plain attribute reads
+    _priority_rank: int = field(default=None, init=False, repr=False, compare=False)
+    # Derived: get_hash() result, computed on first use
+    _text_hash: str = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate on creation"""
         if not self.text or not self.text.strip():
@@ -61,6 +72,12 @@ class Thought:
             raise ValueError("Thought must be at least 3 characters")
         if len(self.text) > 5000:
             raise ValueError("Thought must be less than 5000 characters")
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now().isoformat()
+            self.created_at = self.created_at or now
+            self.updated_at = self.updated_at or now
+        self._text_lower = self.text.lower()
+        self._priority_rank = PRIORITY_ORDER.get(self.priority, 3)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
@@ -72,7 +89,7 @@ class Thought:
             'status': self.status.value,
             'created_at': self.created_at,
             'updated_at': self.updated_at,
-            'tags': self.tags,
+            'tags': list(self.tags),  # Copy: stored records must not share the caller's list
             'confidence': self.confidence,
             'is_archived': self.is_archived,
             'is_deleted': self.is_deleted,
@@ -90,7 +107,7 @@ class Thought:
             id=data.get('id'),
             created_at=data.get('created_at'),
             updated_at=data.get('updated_at'),
-            tags=data.get('tags', []),
+            tags=list(data.get('tags', ())),  # Copy: edits must not reach the cached record
             confidence=data.get('confidence', 0.8),
             is_archived=data.get('is_archived', False),
             is_deleted=data.get('is_deleted', False),
@@ -99,9 +116,10 @@ class Thought:
     
     def soft_delete(self):
         """Soft delete: mark as deleted but keep data"""
+        now = datetime.now().isoformat()
         self.is_deleted = True
-        self.deleted_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.deleted_at = now
+        self.updated_at = now
     
     def restore(self):
         """Restore soft-deleted thought"""
@@ -133,7 +151,9 @@ class Thought:
     
     def get_hash(self) -> str:
         """Get SHA256 hash of thought text for duplicate detection"""
-        return hashlib.sha256(self.text.lower().encode()).hexdigest()
+        if self._text_hash is None:
+            self._text_hash = hashlib.sha256(self._text_lower.encode()).hexdigest()
+        return self._text_hash
 
 
 @dataclass
@@ -3,59 +3,209 @@ Storage layer for Axon Intelligence
 Handles JSON persistence with soft delete and archive support
 """
 
-import json
+import csv
+import io
 import os
+from contextlib import contextmanager
 from typing import List, Optional
 from models import Thought
 
+try:
+    import orjson  # Optional C-backed JSON; stdlib json is used otherwise
+except ImportError:
+    orjson = None
+    import json
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class StorageManager:
-    """Manages data persistence"""
+    """Manages data persistence
     
-    def __init__(self, filename: str = "axon_thoughts.json"):
+    Thoughts are kept in an append-only JSON Lines log: add/update append the
+    full record, a permanent delete appends a tombstone, and the log is
+    compacted once it grows past twice the number of stored thoughts.
+    """
+    
+    def __init__(self, filename: str = "axon_thoughts.jsonl"):
         """Initialize storage"""
         self.filename = filename
+        # Replayed records by id as of the last read/write, and the file state they match
+        self._records = None
+        self._records_stamp = None
+        self._log_lines = 0
+        # Records not yet written, and how many batch() blocks are open
+        self._pending = []
+        self._batch_depth = 0
         self._ensure_db()
     
     def _ensure_db(self):
-        """Ensure database file exists"""
-        if not os.path.exists(self.filename):
-            self.save([])
+        """Ensure database file exists, importing a pre-JSONL .json store if present"""
+        if os.path.exists(self.filename):
+            return
+        
+        legacy = os.path.splitext(self.filename)[0] + ".json"
+        thoughts = []
+        
+        if legacy != self.filename and os.path.exists(legacy):
+            try:
+                with open(legacy, 'rb') as f:
+                    thoughts = [Thought.from_dict(item) for item in _loads(f.read())]
+            except Exception as e:
+                print(f"Error migrating: {e}")
+        
+        self.save(thoughts)
+    
+    def _stamp(self) -> Optional[tuple]:
+        """Modification time and size of the database file (None once it is missing)"""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @property
+    def version(self) -> tuple:
+        """Changes whenever the stored data does; lets callers memoize derived data"""
+        return self._stamp(), len(self._pending)
+    
+    @staticmethod
+    def _apply(records: dict, item: dict):
+        """Apply one log record: a tombstone drops the id, otherwise last write wins"""
+        if '_deleted' in item:
+            records.pop(item['_deleted'], None)
+        else:
+            records[item['id']] = item
+    
+    def _read_records(self) -> dict:
+        """Records by id, replayed from the log only when the file changed on disk"""
+        stamp = self._stamp()
+        if self._records is None or stamp != self._records_stamp:
+            records = {}
+            lines = 0
+            
+            # A deleted or rotated file reads as an empty log; the next append recreates it
+            if stamp is not None:
+                with open(self.filename, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        
+                        lines += 1
+                        self._apply(records, _loads(line))
+            
+            # Unflushed records (inside batch()) stay on top of what another writer added
+            for item in self._pending:
+                self._apply(records, item)
+            
+            self._records = records
+            self._records_stamp = stamp
+            self._log_lines = lines + len(self._pending)
+        return self._records
+    
+    def _append(self, record: dict) -> bool:
+        """Append one record to the log (deferred inside batch())"""
+        records = self._read_records()
+        self._pending.append(record)
+        self._apply(records, record)
+        self._log_lines += 1
+        
+        if self._batch_depth:
+            return True
+        return self.flush()
+    
+    def flush(self) -> bool:
+        """Write pending records in one append, compacting once the log has grown too long"""
+        if not self._pending:
+            return True
+        
+        before = self._stamp()
+        with open(self.filename, 'ab') as f:
+            f.writelines(_dumps(item) + b'\n' for item in self._pending)
+        self._pending.clear()
+        
+        if before == self._records_stamp:
+            self._records_stamp = self._stamp()
+        else:
+            # Another writer changed the file since the last replay; the cache
+            # lacks its records, so replay the whole log on next read
+            self._records = None
+        
+        if self._log_lines > 2 * max(len(self._read_records()), 1):
+            return self.compact()
+        return True
+    
+    @contextmanager
+    def batch(self):
+        """Coalesce every add/update/delete inside the block into a single write"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"Error saving: {e}")
     
     def load(self, include_deleted: bool = False) -> List[Thought]:
         """Load all thoughts"""
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    thoughts = [Thought.from_dict(item) for item in data]
-                    
-                    if not include_deleted:
-                        thoughts = [t for t in thoughts if not t.is_deleted]
-                    
-                    return thoughts
+            # Skip soft-deleted records before building Thought objects for them
+            return [
+                Thought.from_dict(item) for item in self._read_records().values()
+                if include_deleted or not item.get('is_deleted', False)
+            ]
         except Exception as e:
             print(f"Error loading: {e}")
         
         return []
     
     def save(self, thoughts: List[Thought]) -> bool:
-        """Save all thoughts"""
+        """Save all thoughts, rewriting the log"""
         try:
-            with open(self.filename, 'w') as f:
-                data = [thought.to_dict() for thought in thoughts]
-                json.dump(data, f, indent=2)
+            records = {thought.id: thought.to_dict() for thought in thoughts}
+            # Write a synced sibling file and swap it in, so a crash mid-rewrite
+            # leaves either the old log or the new one, never a truncated file
+            tmp = self.filename + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.writelines(_dumps(item) + b'\n' for item in records.values())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filename)
+            # What was just written is what the next load() would replay
+            self._records = records
+            self._records_stamp = self._stamp()
+            self._log_lines = len(records)
+            self._pending.clear()
             return True
         except Exception as e:
             print(f"Error saving: {e}")
             return False
     
+    def compact(self) -> bool:
+        """Drop superseded records and tombstones from the log"""
+        # Replay from disk first so records from other writers are kept
+        self._records = None
+        return self.save(self.load(include_deleted=True))
+    
     def add(self, thought: Thought) -> bool:
         """Add a thought"""
         try:
-            thoughts = self.load(include_deleted=True)
-            thoughts.append(thought)
-            return self.save(thoughts)
+            return self._append(thought.to_dict())
         except Exception as e:
             print(f"Error adding: {e}")
             return False
@@ -63,12 +213,9 @@ class StorageManager:
     def update(self, thought_id: str, thought: Thought) -> bool:
         """Update a thought"""
         try:
-            thoughts = self.load(include_deleted=True)
-            for i, t in enumerate(thoughts):
-                if t.id == thought_id:
-                    thoughts[i] = thought
-                    return self.save(thoughts)
-            return False
+            if thought_id not in self._read_records():
+                return False
+            return self._append(thought.to_dict())
         except Exception as e:
             print(f"Error updating: {e}")
             return False
@@ -76,38 +223,51 @@ class StorageManager:
     def delete(self, thought_id: str) -> bool:
         """Permanently delete a thought"""
         try:
-            thoughts = self.load(include_deleted=True)
-            thoughts = [t for t in thoughts if t.id != thought_id]
-            return self.save(thoughts)
+            if thought_id not in self._read_records():
+                return True
+            return self._append({'_deleted': thought_id})
         except Exception as e:
             print(f"Error deleting: {e}")
             return False
     
     def get_by_id(self, thought_id: str, include_deleted: bool = False) -> Optional[Thought]:
         """Get a specific thought"""
-        thoughts = self.load(include_deleted=include_deleted)
-        for t in thoughts:
-            if t.id == thought_id:
-                return t
-        return None
+        try:
+            item = self._read_records().get(thought_id)
+        except Exception as e:
+            print(f"Error loading: {e}")
+            return None
+        
+        if item is None:
+            return None
+        
+        thought = Thought.from_dict(item)
+        if thought.is_deleted and not include_deleted:
+            return None
+        return thought
     
     def export_csv(self) -> str:
-        """Export as CSV"""
-        thoughts = self.load()
-        
-        if not thoughts:
+        """Export as CSV, straight from the stored records"""
+        try:
+            records = self._read_records()
+        except Exception as e:
+            print(f"Error loading: {e}")
             return ""
         
-        csv_lines = ["id,text,category,priority,status,created_at"]
+        # Rows come from the record dicts; no Thought objects are built
+        rows = (
+            (item['id'], item['text'], item['category'], item['priority'],
+             item.get('status', 'active'), item.get('created_at'))
+            for item in records.values()
+            if not item.get('is_deleted', False)
+        )
         
-        for thought in thoughts:
-            csv_lines.append(
-                f'{thought.id},'
-                f'"{thought.text}",'
-                f'{thought.category.value},'
-                f'{thought.priority.value},'
-                f'{thought.status.value},'
-                f'{thought.created_at}'
-            )
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(('id', 'text', 'category', 'priority', 'status', 'created_at'))
+        header_end = buf.tell()
+        writer.writerows(rows)
         
-        return '\n'.join(csv_lines)
\ No newline at end of file
+        if buf.tell() == header_end:
+            return ""
+        return buf.getvalue()
\ No newline at end of file
@@ -9,8 +9,8 @@ from models import Category, Priority, Status
 from storage import StorageManager
 from logic import ThoughtManager
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
+import math
+import os
 
 # ============================================================================
 # PAGE CONFIG & THEME
@@ -23,140 +23,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Modern crypto dashboard theme with glassmorphism
-st.markdown("""
-    <style>
-    :root {
-        --primary: #6366f1;
-        --primary-dark: #4f46e5;
-        --accent: #06b6d4;
-        --success: #10b981;
-        --danger: #ef4444;
-        --warning: #f59e0b;
-        --bg: #0f172a;
-        --bg-secondary: #1e293b;
-        --bg-tertiary: #334155;
-        --border: #475569;
-        --text-primary: #f1f5f9;
-        --text-secondary: #cbd5e1;
-    }
-    
-    * { font-family: 'Segoe UI', system-ui, -apple-system, sans-serif; }
-    
-    html, body, [data-testid="stAppViewContainer"] {
-        background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-        color: var(--text-primary);
-    }
-    
-    [data-testid="stSidebar"] {
-        background: rgba(15, 23, 42, 0.8);
-        backdrop-filter: blur(10px);
-        border-right: 1px solid rgba(100, 116, 139, 0.2);
-    }
-    
-    .header {
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1), rgba(6, 182, 212, 0.05));
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        backdrop-filter: blur(10px);
-        padding: 30px;
-        border-radius: 12px;
-        margin-bottom: 20px;
-    }
-    
-    .stat-card {
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1), rgba(6, 182, 212, 0.05));
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        backdrop-filter: blur(10px);
-        padding: 20px;
-        border-radius: 10px;
-        transition: all 0.3s ease;
-    }
-    
-    .stat-card:hover {
-        border-color: rgba(99, 102, 241, 0.4);
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.15), rgba(6, 182, 212, 0.1));
-    }
-    
-    .thought-card {
-        background: linear-gradient(135deg, rgba(51, 65, 85, 0.4), rgba(30, 41, 59, 0.6));
-        border: 1px solid rgba(99, 102, 241, 0.2);
-        backdrop-filter: blur(10px);
-        padding: 20px;
-        border-radius: 10px;
-        margin: 10px 0;
-        transition: all 0.3s ease;
-    }
-    
-    .thought-card:hover {
-        border-color: rgba(99, 102, 241, 0.4);
-        transform: translateY(-2px);
-        box-shadow: 0 8px 24px rgba(99, 102, 241, 0.1);
-    }
-    
-    .badge {
-        display: inline-block;
-        padding: 4px 12px;
-        border-radius: 6px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        margin: 4px;
-    }
-    
-    .badge-task {
-        background: rgba(16, 185, 129, 0.2);
-        color: #6ee7b7;
-        border: 1px solid rgba(16, 185, 129, 0.4);
-    }
-    
-    .badge-idea {
-        background: rgba(99, 102, 241, 0.2);
-        color: #a5b4fc;
-        border: 1px solid rgba(99, 102, 241, 0.4);
-    }
-    
-    .badge-worry {
-        background: rgba(239, 68, 68, 0.2);
-        color: #fca5a5;
-        border: 1px solid rgba(239, 68, 68, 0.4);
-    }
-    
-    .badge-high {
-        background: rgba(239, 68, 68, 0.15);
-        color: #fca5a5;
-    }
-    
-    .badge-medium {
-        background: rgba(245, 158, 11, 0.15);
-        color: #fcd34d;
-    }
-    
-    .badge-low {
-        background: rgba(16, 185, 129, 0.15);
-        color: #6ee7b7;
-    }
-    
-    .stButton > button {
-        background: linear-gradient(135deg, #6366f1, #4f46e5);
-        border: none;
-        border-radius: 8px;
-        padding: 10px 24px;
-        color: white;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #4f46e5, #4338ca);
-        box-shadow: 0 8px 16px rgba(99, 102, 241, 0.3);
-        transform: translateY(-2px);
-    }
-    
-    .divider {
-        border-top: 1px solid rgba(100, 116, 139, 0.2);
-        margin: 20px 0;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Modern crypto dashboard theme with glassmorphism (app.css, read once per server process)
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.css")
+
+
+@st.cache_data(show_spinner=False)
+def _load_css(path: str) -> str:
+    """Read the stylesheet and wrap it in a <style> tag"""
+    with open(path, 'r') as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+st.markdown(_load_css(CSS_PATH), unsafe_allow_html=True)
 
 # ============================================================================
 # INITIALIZATION
@@ -168,6 +46,66 @@ if 'storage' not in st.session_state:
 if 'manager' not in st.session_state:
     st.session_state.manager = ThoughtManager(st.session_state.storage)
 
+
+def _analytics_this_run():
+    """get_analytics() memoized until the stored thoughts change"""
+    version = st.session_state.storage.version
+    if st.session_state.get('_analytics_version') != version:
+        st.session_state._analytics = st.session_state.manager.get_analytics()
+        st.session_state._analytics_version = version
+    return st.session_state._analytics
+
+
+# Chart colours per category / priority value
+CHART_COLORS = {
+    "Category": {"task": "#10b981", "idea": "#6366f1", "worry": "#ef4444"},
+    "Priority": {"high": "#ef4444", "medium": "#f59e0b", "low": "#10b981"},
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _count_chart(kind: str, label: str, items: tuple, title: str):
+    """Bar or pie chart of (value, count) pairs, built once per distinct input"""
+    # Imported here so pages without charts never load plotly
+    import plotly.express as px
+    
+    df = {label: [value for value, _ in items], "Count": [count for _, count in items]}
+    
+    if kind == "pie":
+        fig = px.pie(df, values="Count", names=label, title=title,
+                    color_discrete_map=CHART_COLORS[label])
+        fig.update_layout(template="plotly_dark")
+    else:
+        fig = px.bar(df, x=label, y="Count", color=label,
+                    color_discrete_map=CHART_COLORS[label],
+                    title=title)
+        fig.update_layout(template="plotly_dark", showlegend=False)
+    return fig
+
+
+# Selectbox options, built once instead of on every rerun
+CATEGORY_OPTIONS = tuple(Category)
+PRIORITY_OPTIONS = tuple(Priority)
+CATEGORY_INDEX = {c: i for i, c in enumerate(CATEGORY_OPTIONS)}
+PRIORITY_INDEX = {p: i for i, p in enumerate(PRIORITY_OPTIONS)}
+CATEGORY_FILTERS = (None, *CATEGORY_OPTIONS)
+PRIORITY_FILTERS = (None, *PRIORITY_OPTIONS)
+
+# Badge HTML per category / priority, formatted once
+CATEGORY_BADGES = {c: f"<span class='badge badge-{c.value}'>📂 {c.value}</span>" for c in Category}
+PRIORITY_BADGES = {p: f"<span class='badge badge-{p.value}'>⭐ {p.value}</span>" for p in Priority}
+
+# Thoughts rendered per page on the Browse page
+PAGE_SIZE = 25
+
+# Browse status filter option -> get_thoughts(completed=...)
+STATUS_FILTERS = {"All": None, "Active": False, "Completed": True}
+
+
+def _filter_label(option) -> str:
+    """Selectbox label for an optional enum filter"""
+    return "All" if option is None else option.value
+
 # ============================================================================
 # SIDEBAR
 # ============================================================================
@@ -186,7 +124,7 @@ with st.sidebar:
     st.divider()
     st.markdown("### ⚡ Quick Stats")
     
-    analytics = st.session_state.manager.get_analytics()
+    analytics = _analytics_this_run()
     
     col1, col2 = st.columns(2)
     with col1:
@@ -220,7 +158,7 @@ with st.sidebar:
 if page == "🏠 Home":
     st.markdown('<div class="header"><h1>🧠 Axon Intelligence</h1><p>Advanced Thought Organization & AI-Powered Insights</p></div>', unsafe_allow_html=True)
     
-    analytics = st.session_state.manager.get_analytics()
+    analytics = _analytics_this_run()
     
     # Top metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -252,19 +190,12 @@ if page == "🏠 Home":
     
     with col1:
         if analytics.by_category:
-            df_cat = {"Category": list(analytics.by_category.keys()), "Count": list(analytics.by_category.values())}
-            fig = px.bar(df_cat, x="Category", y="Count", color="Category",
-                        color_discrete_map={"task": "#10b981", "idea": "#6366f1", "worry": "#ef4444"},
-                        title="Thoughts by Category")
-            fig.update_layout(template="plotly_dark", showlegend=False)
+            fig = _count_chart("bar", "Category", tuple(analytics.by_category.items()), "Thoughts by Category")
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         if analytics.by_priority:
-            df_pri = {"Priority": list(analytics.by_priority.keys()), "Count": list(analytics.by_priority.values())}
-            fig = px.pie(df_pri, values="Count", names="Priority", title="Priority Distribution",
-                        color_discrete_map={"high": "#ef4444", "medium": "#f59e0b", "low": "#10b981"})
-            fig.update_layout(template="plotly_dark")
+            fig = _count_chart("pie", "Priority", tuple(analytics.by_priority.items()), "Priority Distribution")
             st.plotly_chart(fig, use_container_width=True)
 
 # ============================================================================
@@ -293,8 +224,8 @@ elif page == "➕ Create":
             st.write(f"📂 {auto_category.value.upper()}")
             st.write(f"⭐ {auto_priority.value.upper()}")
             
-            category = st.selectbox("Category", list(Category), index=list(Category).index(auto_category))
-            priority = st.selectbox("Priority", list(Priority), index=list(Priority).index(auto_priority))
+            category = st.selectbox("Category", CATEGORY_OPTIONS, index=CATEGORY_INDEX[auto_category])
+            priority = st.selectbox("Priority", PRIORITY_OPTIONS, index=PRIORITY_INDEX[auto_priority])
         else:
             category = Category.IDEA
             priority = Priority.MEDIUM
@@ -327,62 +258,87 @@ elif page == "📋 Browse":
         search = st.text_input("🔍 Search")
     
     with col2:
-        category_filter = st.selectbox("Category", [None] + list(Category), format_func=lambda x: "All" if x is None else x.value)
+        category_filter = st.selectbox("Category", CATEGORY_FILTERS, format_func=_filter_label)
     
     with col3:
-        priority_filter = st.selectbox("Priority", [None] + list(Priority), format_func=lambda x: "All" if x is None else x.value)
+        priority_filter = st.selectbox("Priority", PRIORITY_FILTERS, format_func=_filter_label)
     
     with col4:
-        status_filter = st.selectbox("Status", ["All", "Active", "Completed"])
+        status_filter = st.selectbox("Status", list(STATUS_FILTERS))
     
     # Get thoughts
     thoughts = st.session_state.manager.get_thoughts(
         search=search if search else None,
         category=category_filter,
         priority=priority_filter,
+        completed=STATUS_FILTERS[status_filter],
         sort_by="priority_date"
     )
     
     if not thoughts:
         st.info("No thoughts found")
     else:
-        st.markdown(f"**{len(thoughts)} thoughts**")
+        total = len(thoughts)
+        st.markdown(f"**{total} thoughts**")
+        
+        # Only the current page's rows get widgets; keys carry thought.id, so
+        # state survives moving between pages
+        page_count = math.ceil(total / PAGE_SIZE)
+        page_num = st.number_input("Page", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+        start = (page_num - 1) * PAGE_SIZE
+        thoughts = thoughts[start:start + PAGE_SIZE]
+        st.caption(f"Showing {start + 1}–{start + len(thoughts)} of {total}")
+        
         st.divider()
         
-        for thought in thoughts:
-            col1, col2 = st.columns([0.1, 0.9])
-            
-            with col1:
-                completed = st.checkbox(
-                    "",
-                    value=(thought.status == Status.COMPLETED),
-                    key=f"cb_{thought.id}"
-                )
-                
-                if completed != (thought.status == Status.COMPLETED):
-                    st.session_state.manager.toggle_complete(thought.id)
-                    st.rerun()
-            
-            with col2:
-                st.markdown('<div class="thought-card">', unsafe_allow_html=True)
-                
-                col_a, col_b = st.columns([0.9, 0.1])
-                
-                with col_a:
-                    st.markdown(f"<span class='badge badge-{thought.category.value}'>📂 {thought.category.value}</span>", unsafe_allow_html=True)
-                    st.markdown(f"<span class='badge badge-{thought.priority.value}'>⭐ {thought.priority.value}</span>", unsafe_allow_html=True)
-                    st.caption(f"{thought.confidence:.0%} confidence")
-                
-                with col_b:
-                    if st.button("🗑️", key=f"del_{thought.id}"):
-                        st.session_state.manager.delete_thought(thought.id)
-                        st.rerun()
+        # Checkbox edits are collected in a form and applied together on submit:
+        # one rerun and one storage write instead of one of each per click
+        toggled = []
+        deleted = []
+        
+        with st.form("browse_thoughts"):
+            for thought in thoughts:
+                is_completed = thought.status is Status.COMPLETED
+                col1, col2 = st.columns([0.1, 0.9])
                 
-                style = "opacity: 0.6; text-decoration: line-through;" if thought.status == Status.COMPLETED else ""
-                st.markdown(f"<div style='{style}'>{thought.text}</div>", unsafe_allow_html=True)
-                st.caption(f"📅 {thought.created_at[:10]}")
+                with col1:
+                    completed = st.checkbox(
+                        "",
+                        value=is_completed,
+                        key=f"cb_{thought.id}"
+                    )
+                    
+                    if completed != is_completed:
+                        toggled.append(thought.id)
                 
-                st.markdown('</div>', unsafe_allow_html=True)
+                with col2:
+                    st.markdown('<div class="thought-card">', unsafe_allow_html=True)
+                    
+                    col_a, col_b = st.columns([0.9, 0.1])
+                    
+                    with col_a:
+                        st.markdown(f"{CATEGORY_BADGES[thought.category]} {PRIORITY_BADGES[thought.priority]}", unsafe_allow_html=True)
+                        st.caption(f"{thought.confidence:.0%} confidence")
+                    
+                    with col_b:
+                        if st.checkbox("🗑️", key=f"del_{thought.id}"):
+                            deleted.append(thought.id)
+                    
+                    style = "opacity: 0.6; text-decoration: line-through;" if is_completed else ""
+                    st.markdown(f"<div style='{style}'>{thought.text}</div>", unsafe_allow_html=True)
+                    st.caption(f"📅 {thought.created_at[:10]}")
+                    
+                    st.markdown('</div>', unsafe_allow_html=True)
+            
+            submitted = st.form_submit_button("Apply changes", type="primary")
+        
+        if submitted and (toggled or deleted):
+            with st.session_state.storage.batch():
+                for thought_id in toggled:
+                    st.session_state.manager.toggle_complete(thought_id)
+                for thought_id in deleted:
+                    st.session_state.manager.delete_thought(thought_id)
+            st.rerun()
 
 # ============================================================================
 # PAGE: ANALYTICS
@@ -391,7 +347,7 @@ elif page == "📋 Browse":
 elif page == "📊 Analytics":
     st.markdown('<div class="header"><h1>Analytics Dashboard</h1></div>', unsafe_allow_html=True)
     
-    analytics = st.session_state.manager.get_analytics()
+    analytics = _analytics_this_run()
     
     col1, col2, col3, col4, col5 = st.columns(5)
     
@@ -412,20 +368,12 @@ elif page == "📊 Analytics":
     
     with col1:
         if analytics.by_category:
-            df_cat = {"Category": list(analytics.by_category.keys()), "Count": list(analytics.by_category.values())}
-            fig = px.bar(df_cat, x="Category", y="Count", color="Category",
-                        color_discrete_map={"task": "#10b981", "idea": "#6366f1", "worry": "#ef4444"},
-                        title="By Category")
-            fig.update_layout(template="plotly_dark", showlegend=False)
+            fig = _count_chart("bar", "Category", tuple(analytics.by_category.items()), "By Category")
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         if analytics.by_priority:
-            df_pri = {"Priority": list(analytics.by_priority.keys()), "Count": list(analytics.by_priority.values())}
-            fig = px.bar(df_pri, x="Priority", y="Count", color="Priority",
-                        color_discrete_map={"high": "#ef4444", "medium": "#f59e0b", "low": "#10b981"},
-                        title="By Priority")
-            fig.update_layout(template="plotly_dark", showlegend=False)
+            fig = _count_chart("bar", "Priority", tuple(analytics.by_priority.items()), "By Priority")
             st.plotly_chart(fig, use_container_width=True)
 
 st.divider()
@@ -5,7 +5,6 @@ Guided workflow with premium ecommerce colors
 """
 
 import streamlit as st
-import json
 import os
 from datetime import datetime
 from enum import Enum
@@ -13,6 +12,12 @@ from uuid import uuid4
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+try:
+    import orjson  # Optional C-backed JSON; stdlib json is used otherwise
+except ImportError:
+    orjson = None
+    import json
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -22,7 +27,7 @@ class Category(str, Enum):
     IDEA = "idea"
     WORRY = "worry"
 
-@dataclass
+@dataclass(slots=True)
 class Thought:
     text: str
     category: Category = Category.TASK
@@ -73,58 +78,119 @@ class Thought:
 # STORAGE
 # ============================================================================
 
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class StorageManager:
-    def __init__(self, filename: str = "axon_unwind_thoughts.json"):
+    """Append-only JSON Lines log: add/update append the full record,
+    compacted once the log grows past twice the number of thoughts"""
+    
+    def __init__(self, filename: str = "axon_unwind_thoughts.jsonl"):
         self.filename = filename
+        self._log_lines = 0
+        self._records = {}
+        self._records_stamp = None  # (mtime_ns, size) the cached records match
+        self._live_count = 0
+        self._migrate_legacy()
+        self._replay()
+    
+    def _migrate_legacy(self):
+        legacy = os.path.splitext(self.filename)[0] + ".json"
+        if os.path.exists(self.filename) or legacy == self.filename or not os.path.exists(legacy):
+            return
+        try:
+            with open(legacy, 'rb') as f:
+                migrated = self.save([Thought.from_dict(item) for item in _loads(f.read())])
+            # Set the old file aside so a later reset doesn't import it again
+            if migrated:
+                os.replace(legacy, legacy + '.migrated')
+        except:
+            pass
     
-    def load(self) -> List[Thought]:
+    def _stamp(self):
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    return [Thought.from_dict(item) for item in data if not item.get('is_deleted', False)]
+            stat = os.stat(self.filename)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def _replay(self) -> dict:
+        """Latest record per id; the log is only reread when the file changed"""
+        stamp = self._stamp()
+        if stamp == self._records_stamp:
+            return self._records
+        
+        records = {}
+        lines = 0
+        try:
+            if stamp is not None:
+                with open(self.filename, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            lines += 1
+                            item = _loads(line)
+                            records[item['id']] = item
         except:
             pass
-        return []
+        self._records, self._records_stamp = records, stamp
+        self._log_lines = lines
+        self._live_count = len(records)  # Also resets to 0 once the file is removed
+        return records
+    
+    def load(self) -> List[Thought]:
+        return [Thought.from_dict(item) for item in self._replay().values() if not item.get('is_deleted', False)]
     
     def save(self, thoughts: List[Thought]) -> bool:
         try:
-            with open(self.filename, 'w') as f:
-                data = [thought.to_dict() for thought in thoughts]
-                json.dump(data, f, indent=2)
+            records = {thought.id: thought.to_dict() for thought in thoughts}
+            tmp = self.filename + '.tmp'  # Synced, then swapped in atomically
+            with open(tmp, 'wb') as f:
+                f.writelines(_dumps(item) + b'\n' for item in records.values())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filename)
+            self._records, self._records_stamp = records, self._stamp()
+            self._log_lines = self._live_count = len(records)
             return True
         except:
             return False
     
+    def _append(self, record: dict) -> bool:
+        records = self._replay()
+        try:
+            with open(self.filename, 'ab') as f:
+                f.write(_dumps(record) + b'\n')
+        except:
+            return False
+        records[record['id']] = record
+        self._live_count = len(records)
+        self._records_stamp = self._stamp()
+        self._log_lines += 1
+        if self._log_lines > 2 * max(self._live_count, 1):
+            return self.save(self._load_all())
+        return True
+    
     def add(self, thought: Thought) -> bool:
-        thoughts = self.load()
-        thoughts.append(thought)
-        return self.save(thoughts)
+        return self._append(thought.to_dict())
     
     def update(self, thought_id: str, thought: Thought) -> bool:
-        all_thoughts = self._load_all()
-        for i, t in enumerate(all_thoughts):
-            if t.id == thought_id:
-                all_thoughts[i] = thought
-                return self._save_all(all_thoughts)
-        return False
+        if thought_id not in self._replay():
+            return False
+        return self._append(thought.to_dict())
     
     def _load_all(self) -> List[Thought]:
-        try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r') as f:
-                    return [Thought.from_dict(item) for item in json.load(f)]
-        except:
-            pass
-        return []
-    
-    def _save_all(self, thoughts: List[Thought]) -> bool:
-        try:
-            with open(self.filename, 'w') as f:
-                json.dump([t.to_dict() for t in thoughts], f, indent=2)
-            return True
-        except:
-            return False
+        return [Thought.from_dict(item) for item in self._replay().values()]
 
 # ============================================================================
 # STREAMLIT CONFIG
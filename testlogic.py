@@ -3,6 +3,9 @@ Unit tests for Axon Intelligence business logic
 Tests all core functions and AI features
 """
 
+import csv
+import io
+import json
 import unittest
 from models import Thought, Category, Priority, Status
 from storage import StorageManager
@@ -123,6 +126,19 @@ class TestThoughtManager(unittest.TestCase):
         results = self.manager.get_thoughts(search="Task")
         self.assertEqual(len(results), 1)
     
+    def test_get_thoughts_completed_filter(self):
+        """Test filtering by completion status"""
+        success, message, done = self.manager.create_thought("Finish the report", Category.TASK)
+        self.manager.create_thought("Plan the trip", Category.TASK)
+        self.manager.toggle_complete(done.id)
+        
+        completed = self.manager.get_thoughts(completed=True)
+        self.assertEqual([t.id for t in completed], [done.id])
+        
+        pending = self.manager.get_thoughts(completed=False)
+        self.assertEqual(len(pending), 1)
+        self.assertNotEqual(pending[0].id, done.id)
+    
     def test_toggle_complete(self):
         """Test completion toggle"""
         success, message, thought = self.manager.create_thought("Test", Category.TASK)
@@ -147,6 +163,54 @@ class TestThoughtManager(unittest.TestCase):
         deleted = self.storage.get_by_id(thought.id, include_deleted=True)
         self.assertTrue(deleted.is_deleted)
     
+    def test_storage_batch(self):
+        """Test batched writes are deferred until the block exits"""
+        with self.storage.batch():
+            self.manager.create_thought("First batched thought", Category.TASK)
+            self.manager.create_thought("Second batched thought", Category.IDEA)
+            
+            # Visible through this storage, not yet on disk
+            self.assertEqual(len(self.storage.load()), 2)
+            self.assertEqual(len(StorageManager(self.storage_file).load()), 0)
+        
+        self.assertEqual(len(StorageManager(self.storage_file).load()), 2)
+    
+    def test_storage_two_writers(self):
+        """Test another writer's records survive a batch and the following compaction"""
+        other = StorageManager(self.storage_file)
+        
+        with self.storage.batch():
+            success, message, first = self.manager.create_thought("From the first writer", Category.TASK)
+            other.add(Thought(text="From the second writer", category=Category.IDEA))
+            
+            # Picking up the other writer's append keeps this batch's unflushed record
+            self.assertTrue(self.storage.update(first.id, first))
+        
+        self.storage.compact()
+        
+        texts = sorted(t.text for t in StorageManager(self.storage_file).load())
+        self.assertEqual(texts, ["From the first writer", "From the second writer"])
+    
+    def test_storage_file_removed(self):
+        """Test a removed database file reads as empty and is recreated on write"""
+        self.manager.create_thought("Before the file was removed", Category.TASK)
+        os.remove(self.storage_file)
+        
+        self.storage.version
+        self.assertEqual(self.storage.load(), [])
+        
+        success, message, thought = self.manager.create_thought("After the file was removed", Category.TASK)
+        self.assertTrue(success)
+        self.assertEqual([t.id for t in StorageManager(self.storage_file).load()], [thought.id])
+    
+    def test_storage_tags_not_shared(self):
+        """Test unsaved edits to a loaded thought don't reach the storage cache"""
+        success, message, thought = self.manager.create_thought("Tagged thought", Category.TASK)
+        
+        self.storage.get_by_id(thought.id).tags.append("unsaved")
+        
+        self.assertEqual(self.storage.get_by_id(thought.id).tags, [])
+    
     def test_analytics(self):
         """Test analytics calculation"""
         # Create various thoughts
@@ -162,6 +226,97 @@ class TestThoughtManager(unittest.TestCase):
         self.assertEqual(len(analytics.by_category), 3)
 
 
+class TestStorageManager(unittest.TestCase):
+    """Test the append-only log"""
+    
+    def setUp(self):
+        """Setup test storage"""
+        self.storage_file = "test_log.jsonl"
+        self.legacy_file = "test_log.json"
+        self.storage = StorageManager(self.storage_file)
+    
+    def tearDown(self):
+        """Cleanup"""
+        for path in (self.storage_file, self.legacy_file):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def _log_lines(self):
+        """Non-empty lines in the log file"""
+        with open(self.storage_file) as f:
+            return [line for line in f if line.strip()]
+    
+    def test_update_last_write_wins(self):
+        """Test the latest appended version is what a fresh load sees"""
+        thought = Thought(text="Write the report", category=Category.TASK)
+        self.storage.add(thought)
+        
+        thought.mark_complete()
+        self.assertTrue(self.storage.update(thought.id, thought))
+        
+        self.assertEqual(len(self._log_lines()), 2)
+        reloaded = StorageManager(self.storage_file).get_by_id(thought.id)
+        self.assertEqual(reloaded.status, Status.COMPLETED)
+    
+    def test_delete_tombstone(self):
+        """Test a permanent delete appends a tombstone that survives a reload"""
+        kept = [Thought(text=f"Keep thought {i}", category=Category.IDEA) for i in range(2)]
+        gone = Thought(text="Remove this one", category=Category.TASK)
+        for thought in (*kept, gone):
+            self.storage.add(thought)
+        
+        self.assertTrue(self.storage.delete(gone.id))
+        
+        self.assertIn('"_deleted"', self._log_lines()[-1])
+        fresh = StorageManager(self.storage_file)
+        self.assertIsNone(fresh.get_by_id(gone.id, include_deleted=True))
+        self.assertEqual({t.id for t in fresh.load()}, {t.id for t in kept})
+    
+    def test_compaction(self):
+        """Test the log is compacted past twice the live count and keeps live records"""
+        first = Thought(text="First thought", category=Category.TASK)
+        second = Thought(text="Second thought", category=Category.IDEA)
+        self.storage.add(first)
+        self.storage.add(second)
+        
+        for _ in range(5):
+            first.mark_complete()
+            self.storage.update(first.id, first)
+            self.assertLessEqual(len(self._log_lines()), 4)
+        
+        fresh = StorageManager(self.storage_file)
+        self.assertEqual({t.id for t in fresh.load()}, {first.id, second.id})
+        self.assertEqual(fresh.get_by_id(first.id).status, Status.COMPLETED)
+    
+    def test_legacy_migration(self):
+        """Test a pre-JSONL .json store is imported on first start"""
+        os.remove(self.storage_file)
+        thought = Thought(text="From the old store", category=Category.WORRY)
+        with open(self.legacy_file, 'w') as f:
+            json.dump([thought.to_dict()], f)
+        
+        storage = StorageManager(self.storage_file)
+        
+        self.assertEqual([t.id for t in storage.load()], [thought.id])
+        self.assertEqual(len(self._log_lines()), 1)
+    
+    def test_export_csv(self):
+        """Test CSV export quotes awkward text and skips soft-deleted thoughts"""
+        self.assertEqual(self.storage.export_csv(), "")
+        
+        text = 'Buy milk, eggs\nand "fresh" bread'
+        kept = Thought(text=text, category=Category.TASK, priority=Priority.HIGH)
+        gone = Thought(text="Soft deleted thought", category=Category.IDEA)
+        gone.soft_delete()
+        self.storage.add(kept)
+        self.storage.add(gone)
+        
+        rows = list(csv.reader(io.StringIO(self.storage.export_csv())))
+        
+        self.assertEqual(rows[0], ['id', 'text', 'category', 'priority', 'status', 'created_at'])
+        self.assertEqual(rows[1:], [[kept.id, text, 'task', 'high', 'active', kept.created_at]])
+
+
 if __name__ == '__main__':
     unittest.main()
 